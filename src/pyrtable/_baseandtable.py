@@ -1,12 +1,19 @@
 import abc
+import functools
 from typing import Optional, Protocol
 
 
+@functools.lru_cache(maxsize=None)
 def encode_table_id(table_id: str) -> str:
     import urllib.parse
     return urllib.parse.quote(table_id)
 
 
+@functools.lru_cache(maxsize=None)
+def _build_table_url(api_root_url: str, base_id: str, table_id: str) -> str:
+    return '%s/%s/%s' % (api_root_url, base_id, encode_table_id(table_id))
+
+
 class BaseAndTableProtocol(Protocol):
     """
     Protocol for classes that support base_id and table_id getters and basic read-only methods.
@@ -44,6 +51,7 @@ class BaseAndTableMethodsMixin(metaclass=abc.ABCMeta):
     """
     Default implementations for :class:`BaseAndTableProtocol` methods.
     """
+    __slots__ = ()
 
     _API_ROOT_URL = 'https://api.airtable.com/v0'
 
@@ -58,10 +66,10 @@ class BaseAndTableMethodsMixin(metaclass=abc.ABCMeta):
     def build_url(self, record_id: Optional[str] = None) -> str:
         self._validate_base_table_ids()
 
-        url = '%s/%s/%s' % (self._API_ROOT_URL, self.get_base_id(), encode_table_id(self.get_table_id()))
-        if record_id is not None:
-            url += '/%s' % record_id
-        return url
+        url = _build_table_url(self._API_ROOT_URL, self.get_base_id(), self.get_table_id())
+        if record_id is None:
+            return url
+        return '%s/%s' % (url, record_id)
 
     def ensure_base_and_table_match(self, other: 'BaseAndTableProtocol'):
         if self.get_base_id() is not None and other.get_base_id() is not None \
@@ -9,8 +9,6 @@ config_dirs_lock = threading.Lock()
 def get_config_dirs() -> List[str]:
     global config_dirs
 
-    import os
-
     if config_dirs is None:
         with config_dirs_lock:
             if config_dirs is None:
@@ -60,8 +58,11 @@ def _load_config_file(filename: str, loader=None):
             def loader(path: str):
                 import yaml
 
+                # Prefer the libyaml bindings, which are much faster than the pure-Python loader
+                safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
                 with open(path, 'rt', encoding='utf-8') as fd:
-                    return yaml.safe_load(fd)
+                    return yaml.load(fd, Loader=safe_loader)
 
         elif ext == '.json':
             # noinspection PyShadowingNames
@@ -87,6 +88,11 @@ def load_config_file(filename: str, loader=None, disable_caching=False):
     if disable_caching:
         return _load_config_file(filename, loader)
 
+    # Files are never removed from the cache, so a hit does not need the lock
+    contents = _cached_config_files.get(filename)
+    if contents is not None:
+        return contents
+
     with _cached_config_files_lock:
         if filename in _cached_config_files:
             return _cached_config_files[filename]
@@ -1,5 +1,9 @@
-from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Type, Union
+import urllib.parse
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
 
+import requests
+
+from ..connectionmanager import get_connection_manager
 from ..exceptions import RequestError
 
 try:
@@ -22,10 +26,6 @@ class BaseContext:
                      record_id: str,
                      base_and_table: 'BaseAndTableProtocol') \
             -> 'BaseRecord':
-        import requests
-
-        from pyrtable.connectionmanager import get_connection_manager
-
         headers = record_cls.get_request_headers(base_id=base_and_table.get_base_id())
         url = base_and_table.build_url(record_id=record_id)
 
@@ -42,26 +42,21 @@ class BaseContext:
 
                 raise RequestError(message=error_message, type=error_type)
 
-        record_data = response.json()
-        record = record_cls(_base_id=base_and_table.get_base_id(), _table_id=base_and_table.get_table_id())
-        record.consume_airtable_data(record_data)
-        return record
+        # noinspection PyProtectedMember
+        return record_cls._from_airtable(
+            response.json(), base_id=base_and_table.get_base_id(), table_id=base_and_table.get_table_id())
 
     def fetch_many(self, *,
                    record_cls: Type['BaseRecord'],
                    base_and_table: 'BaseAndTableProtocol',
-                   record_filter: Optional['BaseFilter'] = None) \
+                   record_filter: Optional['BaseFilter'] = None,
+                   page_size: Optional[int] = None) \
             -> Iterator['BaseRecord']:
-        import urllib.parse
-
-        import requests
-
-        from pyrtable.connectionmanager import get_connection_manager
-
         headers = record_cls.get_request_headers(base_id=base_and_table.get_base_id())
         url = base_and_table.build_url()
         parsed_url = urllib.parse.urlparse(url)
-        url_query_params = urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True)
+        # build_url() does not usually include query parameters
+        url_query_params = urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True) if parsed_url.query else []
 
         if record_filter:
             filter_by_formula = record_filter.build_formula(record_cls)
@@ -71,12 +66,21 @@ class BaseContext:
         column_names = record_cls.get_column_names()
         url_query_params.extend(('fields[]', column_name) for column_name in column_names)
 
+        if page_size is not None:
+            url_query_params.append(('pageSize', str(page_size)))
+
+        # noinspection PyProtectedMember
+        page_url = parsed_url._replace(query=urllib.parse.urlencode(url_query_params)).geturl()
+
+        # Only the offset changes between pages, so the rest of the URL is encoded only once
+        next_page_query = urllib.parse.urlencode([pair for pair in url_query_params if pair[0] != 'offset'])
         # noinspection PyProtectedMember
-        parsed_url = parsed_url._replace(query=urllib.parse.urlencode(url_query_params))
+        next_page_url_prefix = parsed_url._replace(query=next_page_query).geturl() \
+            + ('&offset=' if next_page_query else '?offset=')
 
         while True:
             with get_connection_manager():
-                response = requests.get(parsed_url.geturl(), headers=headers)
+                response = requests.get(page_url, headers=headers)
                 if 400 <= response.status_code < 500:
                     error = response.json().get('error', {})
                     error_message = error.get('message', '')
@@ -85,28 +89,25 @@ class BaseContext:
                     raise RequestError(message=error_message, type=error_type)
 
             response_json = response.json()
-            for record_data in response_json.get('records', []):
-                record = record_cls(_base_id=base_and_table.get_base_id(), _table_id=base_and_table.get_table_id())
-                record.consume_airtable_data(record_data)
-                yield record
-
+            records_data = response_json.get('records', [])
             offset = response_json.get('offset')
+            # Do not hold the current page while the next one is being fetched
+            del response, response_json
+
+            for record_data in records_data:
+                # noinspection PyProtectedMember
+                yield record_cls._from_airtable(
+                    record_data, base_id=base_and_table.get_base_id(), table_id=base_and_table.get_table_id())
+            del records_data
+
             if offset is None:
                 break
 
-            url_query_params = list(filter(lambda pair: pair[0] != 'offset', url_query_params))
-            url_query_params.append(('offset', offset))
-
-            # noinspection PyProtectedMember
-            parsed_url = parsed_url._replace(query=urllib.parse.urlencode(url_query_params))
+            page_url = next_page_url_prefix + urllib.parse.quote_plus(offset)
 
     def _create(self,
                 record_cls: Type['BaseRecord'],
                 record: 'BaseRecord') -> None:
-        import requests
-
-        from pyrtable.connectionmanager import get_connection_manager
-
         url = record.build_url()
         headers = record_cls.get_request_headers({
             'Content-Type': 'application/json',
@@ -127,10 +128,6 @@ class BaseContext:
     def _update(self,
                 record_cls: Type['BaseRecord'],
                 record: 'BaseRecord') -> None:
-        import requests
-
-        from pyrtable.connectionmanager import get_connection_manager
-
         dirty_fields = record.encode_to_airtable()
         if not dirty_fields:
             return
@@ -168,10 +165,6 @@ class BaseContext:
                   record_cls: Type['BaseRecord'],
                   record_id: str,
                   base_and_table: 'BaseAndTableProtocol') -> None:
-        import requests
-
-        from pyrtable.connectionmanager import get_connection_manager
-
         url = base_and_table.build_url(record_id=record_id)
         headers = record_cls.get_request_headers(base_id=base_and_table.get_base_id())
 
@@ -196,19 +189,20 @@ class BaseContext:
         record._created_timestamp = None
         # delete() does not clear data, but anything that is semantically different from None
         # becomes instantly dirty. That's why we are assigning None to all original fields values.
-        for attr_name, field in record.iter_fields():
-            # noinspection PyProtectedMember
+        # noinspection PyProtectedMember
+        for attr_name, field in record._all_fields:
             record._orig_fields_values[attr_name] = field.decode_from_airtable(None, base_and_table=record)
 
 
 class SimpleCachingContext(BaseContext):
     @staticmethod
-    def _build_key(record_cls: Type['BaseRecord'], base_and_table: 'BaseAndTableProtocol', record_id: str) -> str:
+    def _build_key(record_cls: Type['BaseRecord'], base_and_table: 'BaseAndTableProtocol',
+                   record_id: str) -> Tuple[str, str, str]:
         # noinspection PyProtectedMember
         base_and_table._validate_base_table_ids()
-        return '%s:%s:%s' % (record_cls.__name__, base_and_table.get_base_id(), record_id)
+        return record_cls.__name__, base_and_table.get_base_id(), record_id
 
-    _cache: Dict[str, 'BaseRecord']
+    _cache: Dict[Tuple[str, str, str], 'BaseRecord']
 
     def __init__(self,
                  allow_classes: Optional[Iterable[Type['BaseRecord']]] = None,
@@ -269,9 +263,11 @@ class SimpleCachingContext(BaseContext):
     def fetch_many(self, *,
                    record_cls: Type['BaseRecord'],
                    base_and_table: 'BaseAndTableProtocol',
-                   record_filter: Optional['BaseFilter'] = None) -> Iterator['BaseRecord']:
+                   record_filter: Optional['BaseFilter'] = None,
+                   page_size: Optional[int] = None) -> Iterator['BaseRecord']:
         for record in super(SimpleCachingContext, self).fetch_many(
-                record_cls=record_cls, base_and_table=base_and_table, record_filter=record_filter):
+                record_cls=record_cls, base_and_table=base_and_table, record_filter=record_filter,
+                page_size=page_size):
             if self._is_cached_class(record_cls):
                 with self._cache_lock:
                     self._cache[self._build_key(record_cls, record, record.id)] = record
@@ -15,6 +15,13 @@ class BaseField:
     skip_normalization_if_filled: bool
     _record: Optional[BaseRecord]
 
+    def __set_name__(self, owner, name):
+        # Register the field in the class where it is declared, so that records do not need to inspect every class
+        # attribute to find their fields
+        if '_declared_fields' not in owner.__dict__:
+            owner._declared_fields = []
+        owner._declared_fields.append((name, self))
+
     @classmethod
     def _install_extra_properties(cls, record_cls: Type['BaseRecord'], attr_name: str):
         pass
@@ -54,7 +61,7 @@ class BaseField:
         if self.read_only and self._record.id is not None:
             raise AttributeError('%s: This field is read-only' % self.attr_name)
         # noinspection PyProtectedMember
-        instance._fields_values[self.attr_name] = self.validate(value, base_and_table=instance)
+        instance._set_field_value(self.attr_name, self.validate(value, base_and_table=instance))
 
     @classmethod
     def is_same_value(cls, lhs, rhs) -> bool:
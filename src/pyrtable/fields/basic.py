@@ -16,6 +16,28 @@ except ImportError:
 
 from pyrtable.fields import BaseField
 
+_UTC = zoneinfo.ZoneInfo('UTC') if zoneinfo is not None else None
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """
+    Parse a timestamp in the format used by Airtable, e.g. '2020-01-02T03:04:05.678Z'.
+
+    The result is timezone-aware (UTC) if the zoneinfo package is available, otherwise it is naive.
+    """
+    # Fast path for the fixed-width format that Airtable sends
+    if len(value) == 24 and value[4] == '-' and value[7] == '-' and value[10] == 'T' and value[13] == ':' \
+            and value[16] == ':' and value[19] == '.' and value[23] == 'Z':
+        try:
+            return datetime.datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]), int(value[20:23]) * 1000,
+                tzinfo=_UTC)
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=_UTC)
+
 
 class StringField(BaseField):
     def decode_from_airtable(self, value: Optional[str], base_and_table: 'BaseAndTableProtocol') -> str:
@@ -76,6 +98,12 @@ class DateField(BaseField):
             -> Optional[datetime.date]:
         if not value:
             return None
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            # Much faster than strptime(); restricted to 'YYYY-MM-DD', as newer Pythons accept other ISO 8601 forms
+            try:
+                return datetime.date.fromisoformat(value)
+            except ValueError:
+                pass
         return datetime.datetime.strptime(value, '%Y-%m-%d').date()
 
     def encode_to_airtable(self, value: Optional[datetime.date]) -> Optional[str]:
@@ -88,10 +116,7 @@ class DateTimeField(BaseField):
     def decode_from_airtable(self, value, base_and_table: 'BaseAndTableProtocol'):
         if not value:
             return None
-        timestamp = datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ')
-        if zoneinfo is not None:
-            timestamp = timestamp.replace(tzinfo=zoneinfo.ZoneInfo('UTC'))
-        return timestamp
+        return parse_timestamp(value)
 
     def encode_to_airtable(self, value):
         if value is None:
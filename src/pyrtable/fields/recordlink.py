@@ -129,7 +129,7 @@ class _SingleRecordIdLinkProxyField:
     def __set__(self, instance, value: Optional[str]):
         if value is None:
             # noinspection PyProtectedMember
-            instance._fields_values[self._record_attr_name] = value
+            instance._set_field_value(self._record_attr_name, value)
             return
         # @TODO Not really that; also, ignore if value does not change
         raise ValueError(value)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections.abc
+import functools
 from enum import Enum
 from typing import Any, Callable, Generic, Iterable, Iterator, MutableSet, Optional, Type, TypeVar, Union
 
@@ -9,8 +10,11 @@ T_co = TypeVar('T_co', covariant=True)
 
 
 class ValueSet(collections.abc.MutableSet, collections.abc.Iterable, Generic[T]):
+    __slots__ = ('_items', '_validator')
+
     _items: MutableSet[T]
-    _validator: Callable[[T], T] = None
+    # `None` means that values are stored as-is (no validator call at all)
+    _validator: Optional[Callable[[T], T]]
 
     def __init__(self, other: Optional[ValueSet] = None, *, validator: Optional[Callable[[Any], T]] = None):
         if other is not None:
@@ -18,33 +22,35 @@ class ValueSet(collections.abc.MutableSet, collections.abc.Iterable, Generic[T])
             self._validator = other._validator
         else:
             self._items = set()
+            self._validator = None
 
         if validator is not None:
             self._validator = validator
 
-        if self._validator is None:
-            def validator(value: T) -> T:
-                return value
-
-            self._validator = validator
-
     def add(self, x: T) -> None:
-        self._items.add(self._validator(x))
+        validator = self._validator
+        self._items.add(validator(x) if validator is not None else x)
 
     def discard(self, x: T) -> None:
-        self._items.discard(self._validator(x))
+        validator = self._validator
+        self._items.discard(validator(x) if validator is not None else x)
 
     def set(self, iterable: Iterable[T]) -> None:
-        self._items = set(self._validator(value) for value in iterable)
+        validator = self._validator
+        if validator is None:
+            self._items = set(iterable)
+        else:
+            self._items = set(validator(value) for value in iterable)
 
     def __contains__(self, x: Any) -> bool:
-        return self._items.__contains__(self._validator(x))
+        validator = self._validator
+        return self._items.__contains__(validator(x) if validator is not None else x)
 
     def __len__(self) -> int:
-        return self._items.__len__()
+        return len(self._items)
 
     def __iter__(self) -> Iterator[T_co]:
-        return self._items.__iter__()
+        return iter(self._items)
 
     def __iadd__(self, other: T) -> ValueSet[T]:
         self.add(other)
@@ -58,8 +64,26 @@ class ValueSet(collections.abc.MutableSet, collections.abc.Iterable, Generic[T])
         return self._items.__repr__()
 
 
+@functools.lru_cache(maxsize=None)
 def validator_from_enum(enum_class: Type[Enum]) -> Callable[[Union[str, Enum]], Union[str, Enum]]:
+    value_to_member = enum_class._value2member_map_
+    # Classes overriding _missing_ (e.g. Flag) may resolve values that are not in the value map
+    overrides_missing = enum_class._missing_.__func__ is not Enum._missing_.__func__
+
     def validator(value: Union[str, Enum]) -> Union[str, Enum]:
+        if isinstance(value, enum_class):
+            return value
+        try:
+            member = value_to_member.get(value)
+        except TypeError:
+            # Unhashable values can only be looked up by the enum class itself
+            member = None
+        else:
+            if member is not None:
+                return member
+            if not overrides_missing:
+                return value
+
         try:
             return enum_class(value)
         except ValueError:
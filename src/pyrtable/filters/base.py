@@ -9,14 +9,18 @@ class BaseFilter:
     @staticmethod
     def get_field_object(record_class: Type['BaseRecord'], attr_name: str) -> 'BaseField':
         try:
-            return next(field for field_attr_name, field in record_class.iter_fields()
-                        if field_attr_name == attr_name)
-        except StopIteration:
+            # noinspection PyProtectedMember
+            return record_class._attr_to_field[attr_name]
+        except KeyError:
             raise AttributeError("%r has no attribute %r" % (record_class, attr_name))
 
     @staticmethod
     def get_column_name(record_class: Type['BaseRecord'], attr_name: str) -> str:
-        return BaseFilter.get_field_object(record_class=record_class, attr_name=attr_name).column_name
+        try:
+            # noinspection PyProtectedMember
+            return record_class._attr_to_column[attr_name]
+        except KeyError:
+            raise AttributeError("%r has no attribute %r" % (record_class, attr_name))
 
     def __and__(self, other):
         from .raw import AndFilter
@@ -46,12 +46,16 @@ class Q(BaseFilter):
     def extend(self, *args, **kwargs):
         for key, value in kwargs.items():
             filter_cls, attr_name = get_filter(key)
-            self._filter.filters.append(filter_cls(attr_name, value))
+            self._filter.extend(filter_cls(attr_name, value))
 
         for arg in args:
-            if not isinstance(arg, BaseFilter):
+            if isinstance(arg, Q):
+                # Copy the inner filters, so extending this object will not change the other one
+                self._filter.extend(*arg._filter.filters)
+            elif isinstance(arg, BaseFilter):
+                self._filter.extend(arg)
+            else:
                 raise ValueError(arg)
-            self._filter.filters.append(arg)
 
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self._filter)
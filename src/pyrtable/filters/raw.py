@@ -1,62 +1,101 @@
-from typing import TYPE_CHECKING, Any, List, Type
+from typing import TYPE_CHECKING, Any, List, Optional, Type
 
 from .base import BaseFilter
+from pyrtable.fields import BooleanField
+from pyrtable.filterutils import airtable_filter_and, airtable_filter_equals, airtable_filter_greater_than, \
+    airtable_filter_greater_than_or_equals, airtable_filter_less_than, airtable_filter_less_than_or_equals, \
+    airtable_filter_multiple_select_contains, airtable_filter_multiple_select_does_not_contain, \
+    airtable_filter_multiple_select_is_empty, airtable_filter_multiple_select_is_not_empty, airtable_filter_not, \
+    airtable_filter_not_equals, airtable_filter_or, quote_column_name
 
 if TYPE_CHECKING:
     from pyrtable.record import BaseRecord
 
 
 class TrueFilter(BaseFilter):
+    _instance: Optional['TrueFilter'] = None
+
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
         return 'TRUE()'
 
+    def __new__(cls):
+        # Stateless, so a single instance is shared (one per class, so subclasses get their own)
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
     def __repr__(self):
         return 'TRUE()'
 
 
 class FalseFilter(BaseFilter):
+    _instance: Optional['FalseFilter'] = None
+
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
         return 'FALSE()'
 
+    def __new__(cls):
+        # Stateless, so a single instance is shared (one per class, so subclasses get their own)
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
     def __repr__(self):
         return 'FALSE()'
 
 
 class NotFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        if isinstance(self.filter, TrueFilter):
-            return FalseFilter().build_formula(record_class=record_class)
-        if isinstance(self.filter, FalseFilter):
-            return TrueFilter().build_formula(record_class=record_class)
-
-        from pyrtable.filterutils import airtable_filter_not
-
-        if isinstance(self.filter, NotFilter):
-            return self.filter.filter.build_formula(record_class)
         return airtable_filter_not(self.filter.build_formula(record_class))
 
+    def __new__(cls, flt: BaseFilter):
+        # Simplify negations of constants and double negations right away, so that they are never built
+        if isinstance(flt, NotFilter):
+            return flt.filter
+        if isinstance(flt, TrueFilter):
+            return FalseFilter()
+        if isinstance(flt, FalseFilter):
+            return TrueFilter()
+        return super().__new__(cls)
+
     def __init__(self, flt: BaseFilter):
         self.filter = flt
 
+    def __getnewargs__(self):
+        return self.filter,
+
     def __repr__(self):
         return 'NOT(%r)' % self.filter
 
 
 class AndFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        if any(isinstance(flt, FalseFilter) for flt in self.filters):
-            return FalseFilter().build_formula(record_class=record_class)
-
-        from pyrtable.filterutils import airtable_filter_and
         return airtable_filter_and(*(flt.build_formula(record_class) for flt in self.filters))
 
     def __init__(self, *filters: BaseFilter):
         self.filters: List[BaseFilter] = []
+        self.extend(*filters)
 
+    def extend(self, *filters: BaseFilter) -> None:
+        """
+        Add filters to the conjunction, simplifying it as they are added: nested conjunctions are flattened, `TRUE()`
+        filters are dropped (unless alone) and a `FALSE()` filter replaces all others.
+        """
         for flt in filters:
             if isinstance(flt, AndFilter):
-                self.filters.extend(flt.filters)
+                self.extend(*flt.filters)
+            elif len(self.filters) == 1 and isinstance(self.filters[0], FalseFilter):
+                pass
+            elif isinstance(flt, FalseFilter):
+                self.filters[:] = [flt]
+            elif isinstance(flt, TrueFilter):
+                if not self.filters:
+                    self.filters.append(flt)
             else:
+                if len(self.filters) == 1 and isinstance(self.filters[0], TrueFilter):
+                    self.filters.clear()
                 self.filters.append(flt)
 
     def __repr__(self):
@@ -65,19 +104,30 @@ class AndFilter(BaseFilter):
 
 class OrFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        if any(isinstance(flt, TrueFilter) for flt in self.filters):
-            return TrueFilter().build_formula(record_class=record_class)
-
-        from pyrtable.filterutils import airtable_filter_or
         return airtable_filter_or(*(flt.build_formula(record_class) for flt in self.filters))
 
     def __init__(self, *filters: BaseFilter):
         self.filters: List[BaseFilter] = []
+        self.extend(*filters)
 
+    def extend(self, *filters: BaseFilter) -> None:
+        """
+        Add filters to the disjunction, simplifying it as they are added: nested disjunctions are flattened, `FALSE()`
+        filters are dropped (unless alone) and a `TRUE()` filter replaces all others.
+        """
         for flt in filters:
             if isinstance(flt, OrFilter):
-                self.filters.extend(flt.filters)
+                self.extend(*flt.filters)
+            elif len(self.filters) == 1 and isinstance(self.filters[0], TrueFilter):
+                pass
+            elif isinstance(flt, TrueFilter):
+                self.filters[:] = [flt]
+            elif isinstance(flt, FalseFilter):
+                if not self.filters:
+                    self.filters.append(flt)
             else:
+                if len(self.filters) == 1 and isinstance(self.filters[0], FalseFilter):
+                    self.filters.clear()
                 self.filters.append(flt)
 
     def __repr__(self):
@@ -86,8 +136,6 @@ class OrFilter(BaseFilter):
 
 class EqualsFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.fields import BooleanField
-        from pyrtable.filterutils import airtable_filter_equals, quote_column_name
 
         field = self.get_field_object(record_class, self.attr_name)
 
@@ -109,7 +157,6 @@ class EqualsFilter(BaseFilter):
 
 class NotEqualsFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_not_equals
         return airtable_filter_not_equals(column_name=self.get_column_name(record_class, self.attr_name),
                                           value=self.value)
 
@@ -123,7 +170,6 @@ class NotEqualsFilter(BaseFilter):
 
 class GreaterThanFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_greater_than
         return airtable_filter_greater_than(
             column_name=self.get_column_name(record_class, self.attr_name),
             value=self.value)
@@ -138,7 +184,6 @@ class GreaterThanFilter(BaseFilter):
 
 class LessThanFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_less_than
         return airtable_filter_less_than(
             column_name=self.get_column_name(record_class, self.attr_name),
             value=self.value)
@@ -153,7 +198,6 @@ class LessThanFilter(BaseFilter):
 
 class GreaterThanOrEqualsFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_greater_than_or_equals
         return airtable_filter_greater_than_or_equals(
             column_name=self.get_column_name(record_class, self.attr_name),
             value=self.value)
@@ -168,7 +212,6 @@ class GreaterThanOrEqualsFilter(BaseFilter):
 
 class LessThanOrEqualsFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_less_than_or_equals
         return airtable_filter_less_than_or_equals(
             column_name=self.get_column_name(record_class, self.attr_name),
             value=self.value)
@@ -185,10 +228,8 @@ class IsEmptyFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
         column_name = self.get_column_name(record_class, self.attr_name)
         if self.value:
-            from pyrtable.filterutils import airtable_filter_multiple_select_is_empty
             return airtable_filter_multiple_select_is_empty(column_name=column_name)
         else:
-            from pyrtable.filterutils import airtable_filter_multiple_select_is_not_empty
             return airtable_filter_multiple_select_is_not_empty(column_name=column_name)
 
     def __init__(self, attr_name: str, value: Any):
@@ -206,7 +247,6 @@ class IsEmptyFilter(BaseFilter):
 
 class ContainsFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_multiple_select_contains
         column_name = self.get_column_name(record_class, self.attr_name)
         return airtable_filter_multiple_select_contains(column_name=column_name, value=self.value)
 
@@ -220,7 +260,6 @@ class ContainsFilter(BaseFilter):
 
 class DoesNotContainFilter(BaseFilter):
     def build_formula(self, record_class: Type['BaseRecord']) -> str:
-        from pyrtable.filterutils import airtable_filter_multiple_select_does_not_contain
         column_name = self.get_column_name(record_class, self.attr_name)
         return airtable_filter_multiple_select_does_not_contain(column_name=column_name, value=self.value)
 
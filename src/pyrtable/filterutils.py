@@ -1,26 +1,60 @@
+import datetime
 import re
 from enum import Enum
 
+_COLUMN_NAME_ESCAPE_RE = re.compile(r'[}\\]')
+_STRING_ESCAPE_RE = re.compile(r'["\\]')
+
 
 def quote_column_name(column_name: str) -> str:
-    return '{%s}' % re.sub(r'[}\\]', lambda ch: '\\' + ch.group(0), column_name)
+    return '{%s}' % _COLUMN_NAME_ESCAPE_RE.sub(r'\\\g<0>', column_name)
+
+
+def _quote_str(value: str) -> str:
+    return '"%s"' % _STRING_ESCAPE_RE.sub(r'\\\g<0>', value)
+
+
+def _quote_bool(value: bool) -> str:
+    return 'TRUE()' if value else 'FALSE()'
+
+
+def _quote_datetime(value: datetime.datetime) -> str:
+    return format(value, '"%Y-%m-%dT%H:%M:%S.%fZ"')
+
+
+def _quote_date(value: datetime.date) -> str:
+    return format(value, '"%Y-%m-%d"')
+
+
+# Quoting functions for the most common value types, looked up by exact type
+_QUOTERS = {
+    str: _quote_str,
+    bool: _quote_bool,
+    int: str,
+    float: str,
+    datetime.datetime: _quote_datetime,
+    datetime.date: _quote_date,
+}
 
 
 def quote_value(value) -> str:
-    import datetime
+    quoter = _QUOTERS.get(type(value))
+    if quoter is not None:
+        return quoter(value)
 
+    # Subclasses (including enumerations) are handled here
     if isinstance(value, str):
-        return '"%s"' % re.sub(r'(["\\])', lambda ch: '\\' + ch.group(0), value)
+        return _quote_str(value)
     if isinstance(value, bool):
-        return 'TRUE()' if value else 'FALSE()'
+        return _quote_bool(value)
     if isinstance(value, (int, float)):
         return str(value)
     if isinstance(value, Enum):
         return quote_value(value.value)
     if isinstance(value, datetime.datetime):
-        return format(value, '"%Y-%m-%dT%H:%M:%S.%fZ"')
+        return _quote_datetime(value)
     if isinstance(value, datetime.date):
-        return format(value, '"%Y-%m-%d"')
+        return _quote_date(value)
     raise ValueError(value)
 
 
@@ -51,48 +85,40 @@ def airtable_filter_not(inner_filter) -> str:
 
 
 def airtable_filter_equals(column_name, value) -> str:
-    return '{column_name}={value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}={quote_value(value)}'
 
 
 def airtable_filter_not_equals(column_name, value) -> str:
-    return '{column_name}!={value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}!={quote_value(value)}'
 
 
 def airtable_filter_greater_than(column_name, value) -> str:
-    return '{column_name}>{value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}>{quote_value(value)}'
 
 
 def airtable_filter_less_than(column_name, value) -> str:
-    return '{column_name}<{value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}<{quote_value(value)}'
 
 
 def airtable_filter_greater_than_or_equals(column_name, value) -> str:
-    return '{column_name}>={value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}>={quote_value(value)}'
 
 
 def airtable_filter_less_than_or_equals(column_name, value) -> str:
-    return '{column_name}<={value}'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'{quote_column_name(column_name)}<={quote_value(value)}'
 
 
 def airtable_filter_multiple_select_contains(column_name, value):
-    return 'FIND(", "&{value}&", ",", "&{column_name}&", ")>0'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'FIND(", "&{quote_value(value)}&", ",", "&{quote_column_name(column_name)}&", ")>0'
 
 
 def airtable_filter_multiple_select_does_not_contain(column_name, value):
-    return 'FIND(", "&{value}&", ",", "&{column_name}&", ")=0'.format(
-        column_name=quote_column_name(column_name), value=quote_value(value))
+    return f'FIND(", "&{quote_value(value)}&", ",", "&{quote_column_name(column_name)}&", ")=0'
 
 
 def airtable_filter_multiple_select_is_empty(column_name):
-    return 'NOT({column_name})'.format(column_name=quote_column_name(column_name))
+    return f'NOT({quote_column_name(column_name)})'
 
 
 def airtable_filter_multiple_select_is_not_empty(column_name):
-    return '{column_name}!=""'.format(column_name=quote_column_name(column_name))
+    return f'{quote_column_name(column_name)}!=""'
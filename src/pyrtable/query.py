@@ -2,6 +2,7 @@ import collections.abc
 from typing import TYPE_CHECKING, Generic, Iterable, Iterator, Optional, Type, TypeVar
 
 from ._baseandtable import BaseAndTableMethodsMixin
+from .context import get_default_context
 
 if TYPE_CHECKING:
     from .filters.base import BaseFilter
@@ -11,6 +12,62 @@ if TYPE_CHECKING:
 RT = TypeVar('RT', bound='BaseRecord')
 QT = TypeVar('QT', bound='RecordQuery')
 
+# Number of records in each page returned by the Airtable API
+_AIRTABLE_PAGE_SIZE = 100
+
+_END_OF_ITERATION = object()
+
+
+def _iter_prefetched(iterator: Iterator[RT], max_size: int) -> Iterator[RT]:
+    """
+    Consume an iterator in a worker thread, buffering up to `max_size` items ahead of the caller.
+
+    Exceptions raised by the iterator are re-raised in the caller thread. If the caller stops iterating early, the
+    worker thread is signaled to stop and joined.
+    """
+    import queue
+    import threading
+
+    items = queue.Queue(maxsize=max_size)
+    stopped = threading.Event()
+
+    def put(item, error=None) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as ex:
+            put(_END_OF_ITERATION, ex)
+        else:
+            put(_END_OF_ITERATION)
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+    thread = threading.Thread(target=worker, name='pyrtable-prefetch', daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = items.get()
+            if item is _END_OF_ITERATION:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        thread.join()
+
 
 class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], collections.abc.Iterable):
     """
@@ -49,6 +106,7 @@ class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], colle
     _record_class: Optional[Type['BaseRecord']] = None
     _initialised = False
     _is_empty_query = False
+    _prefetch_pages = 0
 
     def __init__(self, flt: Optional['BaseFilter'] = None):
         super().__init__()
@@ -56,8 +114,9 @@ class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], colle
         self._filter = flt
 
     def _shallow_copy(self) -> QT:
-        import copy
-        result = copy.copy(self)
+        # Same as copy.copy(self), minus the __reduce_ex__() round trip
+        result = object.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
         return result
 
     def _shallow_copy_and_initialise(self) -> QT:
@@ -103,12 +162,30 @@ class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], colle
         if result._filter is None:
             result._filter = Q(*args, **kwargs)
         elif isinstance(result._filter, Q):
+            # Never extend the filter in place, as it is shared with the original query
+            result._filter = Q(result._filter)
             result._filter.extend(*args, **kwargs)
         else:
             result._filter = Q(result._filter, *args, **kwargs)
 
         return result
 
+    def set_prefetch(self, pages: int = 1) -> QT:
+        """
+        Fetch records in a background thread while the caller processes the ones already received. Up to `pages` pages
+        of records are buffered ahead of the caller; the background thread may also hold the next page while it waits
+        for room in the buffer, so up to `pages` + 1 pages can be fetched ahead of the caller.
+
+        :param pages: Number of pages to buffer; use `0` to disable prefetching.
+        :return: The resulting query.
+        """
+        if pages < 0:
+            raise ValueError('Invalid number of prefetch pages: %r' % pages)
+
+        result = self._shallow_copy()
+        result._prefetch_pages = pages
+        return result
+
     def get(self, record_id: str) -> RT:
         """
         Return a single record with given identifier, if it exists in the table.
@@ -117,8 +194,6 @@ class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], colle
         :raises KeyError: if no record matches the given record ID.
         :raises ValueError: if filters were applied (currently this is not supported).
         """
-        from pyrtable.context import get_default_context
-
         # Trivial implementation for Record.objects.none().get(...)
         if self._is_empty_query:
             raise KeyError(record_id)
@@ -136,16 +211,41 @@ class RecordQuery(BaseAndTableMethodsMixin, Generic[RT, QT], Iterable[RT], colle
                 ' subclasses.')
         return self._record_class
 
-    def __iter__(self) -> Iterator[RT]:
+    def _iter_records(self, page_size: Optional[int]) -> Iterator[RT]:
         if not self._initialised:
             raise ValueError('Query is not initialised. Use .all(), .filter() or .none() to initialise it.')
 
         if self._is_empty_query:
             return
 
-        from pyrtable.context import get_default_context
-        yield from get_default_context().fetch_many(
-            record_cls=self._get_record_class(), base_and_table=self, record_filter=self._filter)
+        fetch_kwargs = {}
+        if page_size is not None:
+            # Contexts that do not support page sizes still work when iterating without a chunk size
+            fetch_kwargs['page_size'] = page_size
+
+        records = get_default_context().fetch_many(
+            record_cls=self._get_record_class(), base_and_table=self, record_filter=self._filter, **fetch_kwargs)
+
+        if self._prefetch_pages:
+            records = _iter_prefetched(
+                records, max_size=self._prefetch_pages * (_AIRTABLE_PAGE_SIZE if page_size is None else page_size))
+
+        yield from records
+
+    def iterator(self, chunk_size: int = _AIRTABLE_PAGE_SIZE) -> Iterator[RT]:
+        """
+        Iterate over the query records, fetching `chunk_size` records per request. Only one page of records is held at
+        a time (or as many pages as set by :meth:`set_prefetch`, if prefetching is enabled).
+
+        :param chunk_size: Number of records per page, from 1 to 100.
+        """
+        if not 1 <= chunk_size <= _AIRTABLE_PAGE_SIZE:
+            raise ValueError('Invalid chunk size: %r (must be from 1 to %d)' % (chunk_size, _AIRTABLE_PAGE_SIZE))
+
+        return self._iter_records(page_size=chunk_size)
+
+    def __iter__(self) -> Iterator[RT]:
+        return self._iter_records(page_size=None)
 
 
 __all__ = ['RecordQuery']
@@ -1,8 +1,14 @@
 import datetime
+import functools
+import inspect
+import os
 import re
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Protocol, Tuple
 
 from ._baseandtable import BaseAndTableMethodsMixin, BaseAndTableProtocol
+from .configutils import load_config_file
+from .context import get_default_context
 from .query import RecordQuery
 
 try:
@@ -10,27 +16,32 @@ try:
 except ImportError:
     import json
 
-try:
-    import zoneinfo
-except ImportError:
-    try:
-        # noinspection PyPackageRequirements
-        from backports import zoneinfo
-    except ImportError:
-        zoneinfo = None
-
 from pyrtable.fields import BaseField
+from pyrtable.fields.basic import parse_timestamp
 
 if TYPE_CHECKING:
     pass
 
 
-class _MetaManager:
-    table_tag: str = None
-    base_tag: str = None
+_NOT_FOUND = object()
+
+_RECORD_CLASS_NAME_RE = re.compile(r'(.+)Record')
+_CAMEL_CASE_WORD_RE = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
+_LOWER_UPPER_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
 
+
+class _MetaTags(NamedTuple):
+    base_tag: str
+    table_tag: str
+
+
+class _MetaManager:
     def __get__(self, instance, owner):
-        if self.table_tag is None:
+        # The descriptor is shared by all subclasses, so resolved tags are kept in each owner class (which resets them
+        # in `__init_subclass__`)
+        tags = owner._meta_tags
+        if tags is None:
             meta_class = getattr(owner, 'Meta')
             if meta_class is None:
                 raise ValueError('No Meta class defined for class %s' % owner.__name__)
@@ -41,25 +52,26 @@ class _MetaManager:
 
             table_tag = getattr(meta_class, 'table')
             if table_tag is None:
-                m = re.fullmatch(r'(.+)Record', owner.__name__)
+                m = _RECORD_CLASS_NAME_RE.fullmatch(owner.__name__)
                 if not m:
                     raise ValueError(
                         'Meta class does not contain a "table" field,'
                         ' and the table name cannot be inferred from the class name')
 
-                table_tag = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', m.group(1))
-                table_tag = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', table_tag).lower()
+                table_tag = _CAMEL_CASE_WORD_RE.sub(r'\1_\2', m.group(1))
+                table_tag = _CAMEL_CASE_BOUNDARY_RE.sub(r'\1_\2', table_tag).lower()
 
-            self.base_tag = base_tag
-            self.table_tag = table_tag
+            tags = owner._meta_tags = _MetaTags(base_tag=base_tag, table_tag=table_tag)
 
-        return self
+        return tags
 
 
 class _BaseRecordProtocol(Protocol):
     """
     Protocol for :class:`BaseRecord` type hinting.
     """
+    __slots__ = ()
+
     class Meta:
         api_key: str
         base_id: str
@@ -73,8 +85,14 @@ class _BaseRecordProtocol(Protocol):
 class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
     """
     Base class for all table records.
+
+    Record attributes are stored in slots. Subclasses that only declare fields (which are class attributes) can also
+    declare `__slots__ = ()`, so that their instances do not carry a `__dict__`.
     """
 
+    __slots__ = ('_fields_values', '_orig_fields_values', '_id', '_created_timestamp', '_base_id', '_table_id',
+                 '__weakref__')
+
     def get_base_id(self) -> Optional[str]:
         return self.get_class_base_id() if self._base_id is None else self._base_id
 
@@ -83,28 +101,70 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
 
     _ATTRIBUTE_NOT_SPECIFIED = object()
 
-    _base_id: Optional[str] = None
-    _table_id: Optional[str] = None
-    _id: Optional[str] = None
-    _created_timestamp: Optional[datetime.datetime] = None
+    _base_id: Optional[str]
+    _table_id: Optional[str]
+    _id: Optional[str]
+    _created_timestamp: Optional[datetime.datetime]
 
     meta = _MetaManager()
+    _meta_tags: Optional[_MetaTags] = None
     objects = RecordQuery()
 
+    # Lookup tables built once per class (see `__init_subclass__`)
+    _all_fields: Tuple[Tuple[str, BaseField], ...] = ()
+    _attr_to_field: Dict[str, BaseField] = {}
+    _attr_to_column: Dict[str, str] = {}
+    _column_names: Tuple[str, ...] = ()
+    _mutable_fields: Tuple[Tuple[str, BaseField], ...] = ()
+    _field_decoders: Tuple[Tuple[str, str, Callable[..., Any]], ...] = ()
+    _field_encoders: Dict[bool, Dict[str, Tuple[str, Callable[[Any], Any], Callable[[Any, Any], bool]]]] = \
+        {False: {}, True: {}}
+    _meta_attrs_cache: Dict[str, Optional[Tuple[bool, Any]]] = {}
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__()
 
-        for attr_name, field in cls.iter_fields():
+        cls._meta_attrs_cache = {}
+        cls._meta_tags = None
+        cls._all_fields = tuple(cls._collect_fields())
+
+        for attr_name, field in cls._all_fields:
+            if attr_name in ('id', 'created_timestamp'):
+                raise AttributeError(f'"{attr_name}" is a reserved field name and cannot be used')
+            field.attr_name = attr_name
+            if field.column_name is None:
+                field._column_name = attr_name
+            elif isinstance(field.column_name, str):
+                # Column names are used as dictionary keys for every record encoded or decoded
+                field._column_name = sys.intern(field.column_name)
+
             # noinspection PyProtectedMember
             field._install_extra_properties(cls, attr_name)
 
+        cls._attr_to_field = {attr_name: field for attr_name, field in cls._all_fields}
+        cls._attr_to_column = {attr_name: field.column_name for attr_name, field in cls._all_fields}
+        cls._column_names = tuple(field.column_name for _, field in cls._all_fields if field.column_name)
+        # Values of these fields can be changed in place (hence they need to be cloned to detect changes)
+        cls._mutable_fields = tuple((attr_name, field) for attr_name, field in cls._all_fields
+                                    if type(field).clone_value is not BaseField.clone_value)
+        cls._field_decoders = tuple((attr_name, field.column_name, field.decode_from_airtable)
+                                    for attr_name, field in cls._all_fields)
+        # Column name, encoder and comparator of fields that are sent to the server, keyed by the record's `read_only`
+        # Meta attribute
+        # noinspection PyProtectedMember
+        cls._field_encoders = {
+            record_read_only: {attr_name: (field.column_name, field.encode_to_airtable, field.is_same_value)
+                               for attr_name, field in cls._all_fields
+                               if not (record_read_only if field._read_only is None else field._read_only)}
+            for record_read_only in (False, True)}
+
         for attr_name, record_query in cls._iter_record_query_attrs():
             # noinspection PyProtectedMember
             if record_query._record_class is None:
                 record_query._record_class = cls
             elif record_query._record_class is not cls:
-                import copy
-                record_query = copy.copy(record_query)
+                # noinspection PyProtectedMember
+                record_query = record_query._shallow_copy()
                 record_query._record_class = cls
                 setattr(cls, attr_name, record_query)
 
@@ -117,46 +177,47 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
 
     @classmethod
     def _iter_record_query_attrs(cls) -> Iterator[Tuple[str, RecordQuery]]:
-        yielded_attrs = set()
-        yielded_attr_names = set()
+        # Walking the MRO in order, the first definition of each attribute name is the one that is effective
+        record_queries: Dict[str, RecordQuery] = {}
 
         for current_cls in cls.__mro__:
-            for attr_name, attr in list(current_cls.__dict__.items()):
-                if isinstance(attr, RecordQuery) and attr not in yielded_attrs and attr_name not in yielded_attr_names:
-                    yielded_attrs.add(attr)
-                    yielded_attr_names.add(attr_name)
-                    yield attr_name, attr
+            for attr_name, attr in current_cls.__dict__.items():
+                if isinstance(attr, RecordQuery):
+                    record_queries.setdefault(attr_name, attr)
+
+        return iter(record_queries.items())
 
     @classmethod
-    def iter_fields(cls) -> Iterator[Tuple[str, BaseField]]:
-        yielded_attrs = set()
+    def _collect_fields(cls) -> Iterator[Tuple[str, BaseField]]:
+        fields: Dict[str, BaseField] = {}
 
         for current_cls in cls.__mro__:
-            for attr_name, field in list(current_cls.__dict__.items()):
-                if attr_name not in yielded_attrs and isinstance(field, BaseField):
-                    yielded_attrs.add(attr_name)
-                    yield attr_name, field
+            class_dict = current_cls.__dict__
+            # noinspection PyProtectedMember
+            for attr_name, field in class_dict.get('_declared_fields', ()):
+                # Ignore fields that were replaced after the class was created
+                if class_dict.get(attr_name) is field:
+                    fields.setdefault(attr_name, field)
+
+        return iter(fields.items())
+
+    @classmethod
+    def iter_fields(cls) -> Iterator[Tuple[str, BaseField]]:
+        return iter(cls._all_fields)
 
     @classmethod
     def get_column_names(cls) -> List[str]:
-        return [field.column_name for _, field in cls.iter_fields()
-                if field.column_name]
+        return list(cls._column_names)
 
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
 
-        instance._fields = {}
+        instance._id = None
+        instance._created_timestamp = None
 
-        for attr_name, field in cls.iter_fields():
-            if attr_name in ('id', 'created_timestamp'):
-                raise AttributeError(f'"{attr_name}" is a reserved field name and cannot be used')
-            field.attr_name = attr_name
-            instance._fields[attr_name] = field
+        for _, field in cls._all_fields:
             field._record = instance
 
-            if field.column_name is None:
-                field._column_name = attr_name
-
         return instance
 
     def __init__(self, _base_id: Optional[str] = None, _table_id: Optional[str] = None, **kwargs):
@@ -165,39 +226,64 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
         self._base_id = _base_id
         self._table_id = _table_id
         self._fields_values = {}
-        self._orig_fields_values = {}
 
-        for attr_name, field in self.iter_fields():
-            self._fields_values[attr_name] = field.decode_from_airtable(None, base_and_table=self)
+        for attr_name, _, decode in self._field_decoders:
+            self._fields_values[attr_name] = decode(None, base_and_table=self)
         self._clear_dirty_fields()
 
         for key, value in kwargs.items():
-            if key not in self._fields:
+            if key not in self._attr_to_field:
                 TypeError('init() got an unexpected keyword argument %r' % key)
             setattr(self, key, value)
 
+    @classmethod
+    def _from_airtable(cls, data: Dict[str, Any],
+                       base_id: Optional[str] = None, table_id: Optional[str] = None) -> 'BaseRecord':
+        """
+        Create a record from a dictionary of raw data retrieved from the Airtable server.
+        """
+
+        if cls.__init__ is not BaseRecord.__init__:
+            # Respect custom initialisation
+            record = cls(_base_id=base_id, _table_id=table_id)
+        else:
+            # consume_airtable_data() sets all fields, so skip decoding empty values in __init__()
+            record = cls.__new__(cls)
+            record._base_id = base_id
+            record._table_id = table_id
+            record._fields_values = {}
+
+        record.consume_airtable_data(data)
+        return record
+
     def _clear_dirty_fields(self):
-        for attr_name, field in self.iter_fields():
-            self._orig_fields_values[attr_name] = field.clone_value(self._fields_values[attr_name])
+        # `_orig_fields_values` only holds fields that may have changed since the last server operation: those with
+        # mutable values are always there; others are added by `_set_field_value()` when they are first assigned.
+        fields_values = self._fields_values
+        self._orig_fields_values = {attr_name: field.clone_value(fields_values[attr_name])
+                                    for attr_name, field in self._mutable_fields}
+
+    def _set_field_value(self, attr_name: str, value: Any) -> None:
+        fields_values = self._fields_values
+        if attr_name not in self._orig_fields_values:
+            self._orig_fields_values[attr_name] = fields_values[attr_name]
+        fields_values[attr_name] = value
 
     def consume_airtable_data(self, data: Dict[str, Any]):
         """
         Update field values of this record from a dictionary of raw data retrieved from the Airtable server.
+
+        The dictionary is neither changed nor retained.
         """
 
-        data = dict(data)
-        self._id = data.pop('id')
-        self._created_timestamp = datetime.datetime.strptime(data.pop('createdTime'), '%Y-%m-%dT%H:%M:%S.%fZ')
-        if zoneinfo is not None:
-            self._created_timestamp = self._created_timestamp.replace(tzinfo=zoneinfo.ZoneInfo('UTC'))
+        self._id = data['id']
+        self._created_timestamp = parse_timestamp(data['createdTime'])
 
-        fields_values: Dict[str, Any] = data.pop('fields')
+        get_raw_value = data['fields'].get
+        fields_values = self._fields_values
 
-        for attr_name, field in self.iter_fields():
-            if field.column_name is None:
-                continue
-            value = field.decode_from_airtable(fields_values.get(field.column_name), base_and_table=self)
-            self._fields_values[attr_name] = value
+        for attr_name, column_name, decode in self._field_decoders:
+            fields_values[attr_name] = decode(get_raw_value(column_name), base_and_table=self)
 
         self._clear_dirty_fields()
 
@@ -214,7 +300,6 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
         Delete this record from Airtable.
         """
 
-        from pyrtable.context import get_default_context
         get_default_context().delete(self.__class__, self)
 
     def save(self) -> None:
@@ -222,7 +307,6 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
         Save this record to Airtable.
         """
 
-        from pyrtable.context import get_default_context
         get_default_context().save(self.__class__, self)
 
     def encode_to_airtable(self, include_non_dirty_fields=False) -> Dict[str, Any]:
@@ -234,23 +318,35 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
         :result: The dictionary of raw field values.
         """
 
-        result = {}
-
-        for attr_name, field in self.iter_fields():
-            if field.read_only or field.column_name is None:
-                continue
+        orig_fields_values = self._orig_fields_values
+        if not orig_fields_values and not include_non_dirty_fields:
+            # No field was assigned (nor holds a mutable value) since the last server operation
+            return {}
 
-            value = self._fields_values[attr_name]
-            if not include_non_dirty_fields \
-                    and field.is_same_value(value, self._orig_fields_values[attr_name]):
+        result = {}
+        fields_values = self._fields_values
+        field_encoders = self._field_encoders[bool(self._get_meta_attr('read_only', False))]
+
+        if include_non_dirty_fields:
+            for attr_name, (column_name, encode, _) in field_encoders.items():
+                result[column_name] = encode(fields_values[attr_name])
+            return result
+
+        # Fields missing from `_orig_fields_values` did not change, so there's no need to check them
+        for attr_name, orig_value in orig_fields_values.items():
+            field_encoder = field_encoders.get(attr_name)
+            if field_encoder is None:
                 continue
 
-            result[field.column_name] = field.encode_to_airtable(value)
+            column_name, encode, is_same_value = field_encoder
+            value = fields_values[attr_name]
+            if not is_same_value(value, orig_value):
+                result[column_name] = encode(value)
 
         return result
 
     def normalize_fields(self) -> None:
-        for field in self._fields.values():
+        for _, field in self._all_fields:
             if field.normalize is not None:
                 if field.skip_normalization_if_filled and getattr(self, field.attr_name):
                     # @TODO Differ False and None if the field is boolean
@@ -268,55 +364,82 @@ class BaseRecord(BaseAndTableMethodsMixin, _BaseRecordProtocol):
 
     @classmethod
     def get_request_headers(cls, defaults=None, base_id: Optional[str] = None) -> Dict[str, str]:
-        if not defaults:
-            defaults = {}
-
-        result = dict(**defaults)
+        result = dict(defaults) if defaults else {}
         result['Authorization'] = 'Bearer %s' % cls._get_api_key(base_id=base_id)
 
         return result
 
+    @classmethod
+    def _find_meta_attr(cls, attr_name: str) -> Optional[Tuple[bool, Any]]:
+        """
+        Find which Meta class defines an attribute.
+
+        :return: `None` if the attribute is not defined; otherwise an `(is_getter, value)` tuple, where `value` is
+         either the attribute value itself or the `get_<attr_name>` function that returns it.
+        """
+        getter_name = 'get_' + attr_name
+
+        for current_cls in cls.__mro__:
+            meta_class = current_cls.__dict__.get('Meta')
+            if meta_class is None:
+                continue
+
+            value = getattr(meta_class, attr_name, _NOT_FOUND)
+            if value is not _NOT_FOUND:
+                return False, value
+
+            getter = getattr(meta_class, getter_name, _NOT_FOUND)
+            if getter is not _NOT_FOUND:
+                return True, getter
+
+        return None
+
     @classmethod
     def _get_meta_attr(cls, attr_name: str, default_value: Any = _ATTRIBUTE_NOT_SPECIFIED) -> Any:
-        meta_class = getattr(cls, 'Meta', None)
-        if meta_class is not None:
-            if hasattr(meta_class, attr_name):
-                return getattr(meta_class, attr_name)
-            elif hasattr(meta_class, 'get_' + attr_name):
-                return getattr(meta_class, 'get_' + attr_name)()
-
-        for base_class in cls.__bases__:
-            if issubclass(base_class, BaseRecord):
-                parent_attribute_not_specified = object()
-                value = base_class._get_meta_attr(attr_name=attr_name,
-                                                  default_value=parent_attribute_not_specified)
-                if value != parent_attribute_not_specified:
-                    return value
-
-        if default_value != BaseRecord._ATTRIBUTE_NOT_SPECIFIED:
+        # Meta classes do not change after class creation, so only getters are called every time
+        try:
+            found = cls._meta_attrs_cache[attr_name]
+        except KeyError:
+            found = cls._meta_attrs_cache[attr_name] = cls._find_meta_attr(attr_name)
+
+        if found is not None:
+            is_getter, value = found
+            return value() if is_getter else value
+
+        if default_value is not BaseRecord._ATTRIBUTE_NOT_SPECIFIED:
             return default_value
 
         raise AttributeError("'Meta.%s' attribute is not defined for class %r" % (attr_name, cls.__name__))
 
     @classmethod
-    def _get_api_key(cls, base_id: str) -> str:
-        import functools
-        import inspect
+    @functools.lru_cache(maxsize=None)
+    def _get_api_key_functions(cls) -> Tuple[Tuple[Callable[..., Optional[str]], bool], ...]:
+        """
+        Find all `get_api_key()` functions along the class hierarchy.
+
+        :return: A tuple of `(function, accepts_base_id)` pairs, where `accepts_base_id` tells if `base_id` can be sent
+         to the function as a keyword argument.
+        """
+        result = []
 
         for base_cls in inspect.getmro(cls):
             if hasattr(base_cls, 'get_api_key'):
                 function = base_cls.get_api_key
 
                 signature = inspect.signature(function)
-                # Can base_id be sent as a keyword argument?
-                if 'base_id' in signature.parameters \
-                        or any(parameter.kind is inspect.Parameter.VAR_KEYWORD
-                               for parameter in signature.parameters.values()):
-                    function = functools.partial(function, base_id=base_id)
+                accepts_base_id = 'base_id' in signature.parameters \
+                    or any(parameter.kind is inspect.Parameter.VAR_KEYWORD
+                           for parameter in signature.parameters.values())
+                result.append((function, accepts_base_id))
+
+        return tuple(result)
 
-                result = function()
-                if result is not None:
-                    return result
+    @classmethod
+    def _get_api_key(cls, base_id: str) -> str:
+        for function, accepts_base_id in cls._get_api_key_functions():
+            result = function(base_id=base_id) if accepts_base_id else function()
+            if result is not None:
+                return result
 
         api_key = cls._get_meta_attr('api_key', default_value=None)
         if api_key is None:
@@ -343,7 +466,6 @@ class APIKeyFromEnvMixin:
 
     @classmethod
     def get_api_key(cls) -> Optional[str]:
-        import os
         return os.getenv('AIRTABLE_API_KEY') or None
 
 
@@ -359,10 +481,6 @@ class APIKeyFromSecretsFileMixin:
 
     @classmethod
     def get_api_key(cls, base_id: str):
-        import os
-
-        from pyrtable.configutils import load_config_file
-
         airtable_secrets_filename = os.getenv('AIRTABLE_SECRETS_FILENAME')
         if not airtable_secrets_filename:
             airtable_secrets_filename = cls.AIRTABLE_SECRETS_FILENAME
@@ -382,12 +500,12 @@ class TableIDFromClassNameMixin:
         if table_id is not None:
             return table_id
 
-        m = re.fullmatch(r'(.+)Record', cls.__name__)
+        m = _RECORD_CLASS_NAME_RE.fullmatch(cls.__name__)
         if not m:
             raise AttributeError("Class %r does not have a name that ends with 'Record'")
 
         table_id = m.group(1)
-        table_id = re.sub(r'([a-z])([A-Z])', r'\1 \2', table_id)
+        table_id = _LOWER_UPPER_BOUNDARY_RE.sub(r'\1 \2', table_id)
         return table_id
 
 
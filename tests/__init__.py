@@ -1,4 +1,6 @@
 from .q import *
+from .query import *
 from .raw import *
+from .record import *
 from .server import *
 from .url import *
@@ -98,6 +98,22 @@ class QTests(unittest.TestCase):
         self.assertEqual((~(~flt)).build_formula(TestRecord), "{Integer Field}=15")
         self.assertEqual((~(~(~flt))).build_formula(TestRecord), "NOT({Integer Field}=15)")
 
+    def test_chained_filters(self):
+        query = TestRecord.objects.filter(int_field=15)
+        narrowed_query = query.filter(float_field=2.5)
+        self.assertEqual(query._filter.build_formula(TestRecord),
+                         "{Integer Field}=15")
+        self.assertEqual(narrowed_query._filter.build_formula(TestRecord),
+                         "AND({Integer Field}=15,{Float Field}=2.5)")
+
+    def test_nested_filter_changes(self):
+        flt = Q(int_field=15) | Q(float_field=2.5)
+        query = Q(flt)
+        self.assertEqual(query.build_formula(TestRecord), "OR({Integer Field}=15,{Float Field}=2.5)")
+        flt.extend(Q(string_field="String"))
+        self.assertEqual(query.build_formula(TestRecord),
+                         'OR({Integer Field}=15,{Float Field}=2.5,{String Field}="String")')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from typing import Iterator, List, Optional, Type
+
+from pyrtable.context import BaseContext, get_default_context, set_default_context
+from pyrtable.fields import StringField
+from pyrtable.record import BaseRecord
+
+
+class QueryTestRecord(BaseRecord):
+    class Meta:
+        base_id = 'appTestBaseID'
+        table_id = 'Test Table ID'
+
+    name = StringField('Name')
+
+
+class ListContext(BaseContext):
+    def __init__(self, records_data: List[dict]):
+        self.records_data = records_data
+        self.page_sizes = []
+
+    def fetch_many(self, *,
+                   record_cls: Type['BaseRecord'],
+                   base_and_table,
+                   record_filter=None,
+                   page_size: Optional[int] = None) -> Iterator['BaseRecord']:
+        self.page_sizes.append(page_size)
+        for record_data in self.records_data:
+            if isinstance(record_data, Exception):
+                raise record_data
+            # noinspection PyProtectedMember
+            yield record_cls._from_airtable(record_data)
+
+
+class LegacyListContext(BaseContext):
+    def __init__(self, records_data: List[dict]):
+        self.records_data = records_data
+
+    def fetch_many(self, *,
+                   record_cls: Type['BaseRecord'],
+                   base_and_table,
+                   record_filter=None) -> Iterator['BaseRecord']:
+        for record_data in self.records_data:
+            # noinspection PyProtectedMember
+            yield record_cls._from_airtable(record_data)
+
+
+def build_records_data(count: int) -> List[dict]:
+    return [
+        {'id': 'rec%d' % index, 'createdTime': '2020-01-02T03:04:05.678Z', 'fields': {'Name': 'Name %d' % index}}
+        for index in range(count)
+    ]
+
+
+class RecordQueryTests(unittest.TestCase):
+    def setUp(self):
+        self.previous_context = get_default_context()
+
+    def tearDown(self):
+        set_default_context(self.previous_context)
+
+    def test_prefetch(self):
+        set_default_context(ListContext(build_records_data(250)))
+
+        query = QueryTestRecord.objects.all()
+        prefetched_query = query.set_prefetch(1)
+        self.assertEqual([record.id for record in prefetched_query], [record.id for record in query])
+
+        # Stopping early must not leave the worker thread behind
+        records = iter(prefetched_query)
+        self.assertEqual(next(records).name, 'Name 0')
+        records.close()
+
+    def test_iterator(self):
+        context = ListContext(build_records_data(5))
+        set_default_context(context)
+
+        query = QueryTestRecord.objects.all()
+        self.assertEqual([record.id for record in query.iterator(chunk_size=2)],
+                         ['rec0', 'rec1', 'rec2', 'rec3', 'rec4'])
+        self.assertEqual([record.id for record in query.set_prefetch(2).iterator(chunk_size=2)],
+                         ['rec0', 'rec1', 'rec2', 'rec3', 'rec4'])
+        list(query)
+        self.assertEqual(context.page_sizes, [2, 2, None])
+
+        with self.assertRaises(ValueError):
+            query.iterator(chunk_size=0)
+        with self.assertRaises(ValueError):
+            query.iterator(chunk_size=101)
+
+    def test_context_without_page_size(self):
+        set_default_context(LegacyListContext(build_records_data(2)))
+
+        self.assertEqual([record.id for record in QueryTestRecord.objects.all()], ['rec0', 'rec1'])
+
+    def test_prefetch_error(self):
+        set_default_context(ListContext(build_records_data(2) + [RuntimeError('Failure')]))
+
+        records = iter(QueryTestRecord.objects.all().set_prefetch())
+        self.assertEqual(next(records).id, 'rec0')
+        self.assertEqual(next(records).id, 'rec1')
+        with self.assertRaises(RuntimeError):
+            next(records)
@@ -1,8 +1,10 @@
 import datetime
+import pickle
 import unittest
 
 from pyrtable.fields import BooleanField, DateField, DateTimeField, FloatField, IntegerField, MultipleSelectionField, \
     StringField
+from pyrtable.filters.base import BaseFilter
 from pyrtable.filters.raw import *
 from pyrtable.filterutils import quote_value
 from pyrtable.record import BaseRecord
@@ -93,6 +95,16 @@ class RawFilterFormulaTests(unittest.TestCase):
             self.assertEqual(flt.build_formula(TestRecord),
                              '%s({Integer Field}=15,{Float Field}!=2.5,{String Field}="String")' % function)
 
+    def test_custom_filters(self):
+        class CustomFilter(BaseFilter):
+            def build_formula(self, record_class):
+                return 'CUSTOM()'
+
+        flt = EqualsFilter('int_field', 15)
+        self.assertEqual(AndFilter(flt, CustomFilter()).build_formula(TestRecord), 'AND({Integer Field}=15,CUSTOM())')
+        self.assertEqual(OrFilter(flt, CustomFilter()).build_formula(TestRecord), 'OR({Integer Field}=15,CUSTOM())')
+        self.assertEqual(NotFilter(CustomFilter()).build_formula(TestRecord), 'NOT(CUSTOM())')
+
     def test_and_or_with_boolean_filters(self):
         self.assertEqual(OrFilter(TrueFilter()).build_formula(TestRecord),
                          "TRUE()")
@@ -103,12 +115,38 @@ class RawFilterFormulaTests(unittest.TestCase):
         self.assertEqual(AndFilter(FalseFilter(), EqualsFilter('int_field', 15)).build_formula(TestRecord),
                          "FALSE()")
 
+    def test_and_or_filters_simplification(self):
+        flt1 = EqualsFilter('int_field', 15)
+        flt2 = EqualsFilter('float_field', 1.5)
+        self.assertEqual(AndFilter(TrueFilter(), flt1, flt2).filters, [flt1, flt2])
+        self.assertEqual(OrFilter(FalseFilter(), flt1, flt2).filters, [flt1, flt2])
+        self.assertEqual([type(flt) for flt in AndFilter(flt1, FalseFilter(), flt2).filters], [FalseFilter])
+        self.assertEqual([type(flt) for flt in OrFilter(flt1, TrueFilter(), flt2).filters], [TrueFilter])
+
     def test_not_filter(self):
         flt = EqualsFilter('int_field', 15)
         self.assertEqual(NotFilter(flt).build_formula(TestRecord), "NOT({Integer Field}=15)")
         self.assertEqual(NotFilter(NotFilter(flt)).build_formula(TestRecord), "{Integer Field}=15")
         self.assertEqual(NotFilter(NotFilter(NotFilter(flt))).build_formula(TestRecord), "NOT({Integer Field}=15)")
 
+    def test_boolean_filters_are_singletons(self):
+        self.assertIs(TrueFilter(), TrueFilter())
+        self.assertIs(FalseFilter(), FalseFilter())
+        self.assertIs(pickle.loads(pickle.dumps(TrueFilter())), TrueFilter())
+
+        class CustomTrueFilter(TrueFilter):
+            pass
+
+        self.assertIs(type(CustomTrueFilter()), CustomTrueFilter)
+        self.assertIs(CustomTrueFilter(), CustomTrueFilter())
+        self.assertIs(type(TrueFilter()), TrueFilter)
+
+    def test_not_filter_simplification(self):
+        flt = EqualsFilter('int_field', 15)
+        self.assertIs(NotFilter(NotFilter(flt)), flt)
+        self.assertIsInstance(NotFilter(TrueFilter()), FalseFilter)
+        self.assertIsInstance(NotFilter(FalseFilter()), TrueFilter)
+
     def test_not_with_boolean_filters(self):
         self.assertEqual(NotFilter(TrueFilter()).build_formula(TestRecord),
                          "FALSE()")
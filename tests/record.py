@@ -0,0 +1,179 @@
+import datetime
+import enum
+import unittest
+
+from pyrtable.fields import DateField, IntegerField, MultipleSelectionField, StringField
+from pyrtable.fields.basic import parse_timestamp
+from pyrtable.fields.valueset import validator_from_enum
+from pyrtable.record import BaseRecord
+
+
+class TestRecord(BaseRecord):
+    class Meta:
+        base_id = 'appTestBaseID'
+        table_id = 'Test Table ID'
+
+    string_field = StringField('String Field')
+    int_field = IntegerField('Integer Field')
+    multi_sel_field = MultipleSelectionField('MultiSel Field')
+    read_only_field = StringField('Read-only Field', read_only=True)
+
+
+def build_record() -> TestRecord:
+    record = TestRecord()
+    record.consume_airtable_data({
+        'id': 'rec1',
+        'createdTime': '2020-01-02T03:04:05.678Z',
+        'fields': {
+            'String Field': 'String',
+            'Integer Field': 15,
+            'MultiSel Field': ['Value'],
+            'Read-only Field': 'Read-only',
+        },
+    })
+    return record
+
+
+class DirtyFieldsTests(unittest.TestCase):
+    def test_unchanged_record(self):
+        record = build_record()
+        self.assertEqual(record.encode_to_airtable(), {})
+        self.assertEqual(record.encode_to_airtable(include_non_dirty_fields=True), {
+            'String Field': 'String',
+            'Integer Field': 15,
+            'MultiSel Field': ['Value'],
+        })
+
+    def test_assigned_fields(self):
+        record = build_record()
+        record.int_field = 15
+        self.assertEqual(record.encode_to_airtable(), {})
+
+        record.int_field = 16
+        record.string_field = 'Another String'
+        self.assertEqual(record.encode_to_airtable(), {
+            'Integer Field': 16,
+            'String Field': 'Another String',
+        })
+
+        record.int_field = 15
+        self.assertEqual(record.encode_to_airtable(), {
+            'String Field': 'Another String',
+        })
+
+    def test_changed_in_place(self):
+        record = build_record()
+        record.multi_sel_field.add('Another Value')
+        self.assertEqual(record.encode_to_airtable().keys(), {'MultiSel Field'})
+
+    def test_new_record(self):
+        record = TestRecord(int_field=15)
+        self.assertEqual(record.encode_to_airtable(), {'Integer Field': 15})
+
+    def test_clear_dirty_fields(self):
+        record = build_record()
+        record.int_field = 16
+        record.multi_sel_field.add('Another Value')
+        record._clear_dirty_fields()
+        self.assertEqual(record.encode_to_airtable(), {})
+
+
+class SlottedTestRecord(BaseRecord):
+    __slots__ = ()
+
+    class Meta:
+        base_id = 'appTestBaseID'
+        table_id = 'Test Table ID'
+
+    string_field = StringField('String Field')
+
+
+class SlotsTests(unittest.TestCase):
+    def test_slotted_record(self):
+        record = SlottedTestRecord(string_field='String')
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertIsNone(record.id)
+        self.assertEqual(record.encode_to_airtable(), {'String Field': 'String'})
+
+
+class FirstTagsRecord(BaseRecord):
+    class Meta:
+        base = 'first_base'
+        table = None
+
+
+class SecondTagsRecord(BaseRecord):
+    class Meta:
+        base = 'second_base'
+        table = 'second_table'
+
+
+class MetaTagsTests(unittest.TestCase):
+    def test_tags_per_class(self):
+        self.assertEqual(FirstTagsRecord.meta.base_tag, 'first_base')
+        self.assertEqual(FirstTagsRecord.meta.table_tag, 'first_tags')
+        self.assertEqual(SecondTagsRecord.meta.base_tag, 'second_base')
+        self.assertEqual(SecondTagsRecord.meta.table_tag, 'second_table')
+
+
+class ParseTimestampTests(unittest.TestCase):
+    def test_parse_timestamp(self):
+        for value in ('2020-01-02T03:04:05.678Z', '2020-01-02T03:04:05.6Z', '2020-01-02T03:04:05.123456Z'):
+            timestamp = parse_timestamp(value)
+            self.assertEqual(timestamp.replace(tzinfo=None),
+                             datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ'))
+            if timestamp.tzinfo is not None:
+                self.assertEqual(timestamp.utcoffset(), datetime.timedelta(0))
+
+        with self.assertRaises(ValueError):
+            parse_timestamp('2020-13-02T03:04:05.678Z')
+
+    def test_decode_date(self):
+        field = DateField('Date Field')
+        self.assertEqual(field.decode_from_airtable('2020-01-05', base_and_table=None), datetime.date(2020, 1, 5))
+        self.assertEqual(field.decode_from_airtable('2020-1-5', base_and_table=None), datetime.date(2020, 1, 5))
+        for value in ('20200105', '2020-W01-1', '2020-13-01'):
+            with self.assertRaises(ValueError):
+                field.decode_from_airtable(value, base_and_table=None)
+
+
+class Color(enum.Enum):
+    RED = 'Red'
+    GREEN = 'Green'
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return {member.value.lower(): member for member in cls}.get(value.lower())
+        return None
+
+
+class PlainColor(enum.Enum):
+    RED = 'Red'
+    GREEN = 'Green'
+
+
+class Permission(enum.Flag):
+    READ = 1
+    WRITE = 2
+
+
+class ValidatorFromEnumTests(unittest.TestCase):
+    def test_validator_from_enum(self):
+        color_validator = validator_from_enum(Color)
+        self.assertIs(color_validator('Red'), Color.RED)
+        self.assertIs(color_validator(Color.GREEN), Color.GREEN)
+        self.assertIs(color_validator('red'), Color.RED)
+        self.assertEqual(color_validator('Blue'), 'Blue')
+
+        plain_color_validator = validator_from_enum(PlainColor)
+        self.assertIs(plain_color_validator('Red'), PlainColor.RED)
+        self.assertEqual(plain_color_validator('red'), 'red')
+        self.assertEqual(plain_color_validator(['Red']), ['Red'])
+
+        permission_validator = validator_from_enum(Permission)
+        self.assertEqual(permission_validator(3), Permission.READ | Permission.WRITE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,44 +5,25 @@ from typing import Optional
 from pyrtable.fields import StringField
 from pyrtable.record import BaseRecord
 
-api_key: Optional[str]
-base_id: Optional[str]
-table_id: Optional[str]
-has_test_config_data: Optional[bool] = None
-
-
-def prepare_config_data() -> None:
-    global api_key, base_id, table_id, has_test_config_data
-
-    if has_test_config_data is not None:
-        return
-
-    api_key = os.getenv('AIRTABLE_API_KEY')
-    base_id = os.getenv('AIRTABLE_TEST_BASE_ID')
-    table_id = os.getenv('AIRTABLE_TEST_TABLE_ID')
-    has_test_config_data = bool(api_key) and bool(base_id) and bool(table_id)
-
-
-def is_test_config_data_available() -> bool:
-    prepare_config_data()
-    return has_test_config_data
+# Read once, when the tests are loaded
+api_key: Optional[str] = os.getenv('AIRTABLE_API_KEY')
+base_id: Optional[str] = os.getenv('AIRTABLE_TEST_BASE_ID')
+table_id: Optional[str] = os.getenv('AIRTABLE_TEST_TABLE_ID')
+has_test_config_data: bool = bool(api_key) and bool(base_id) and bool(table_id)
 
 
 class TestRecord(BaseRecord):
     class Meta:
         @classmethod
         def get_api_key(cls):
-            prepare_config_data()
             return api_key
 
         @classmethod
         def get_base_id(cls):
-            prepare_config_data()
             return base_id
 
         @classmethod
         def get_table_id(cls):
-            prepare_config_data()
             return table_id
 
     key_field = StringField('Key Field')
@@ -55,7 +36,7 @@ class TestRecord(BaseRecord):
 
 # noinspection PyMethodMayBeStatic
 @unittest.skipUnless(
-    is_test_config_data_available(),
+    has_test_config_data,
     "Server config data and authentication must be provided by AIRTABLE_API_KEY, AIRTABLE_TEST_BASE_ID"
     " and AIRTABLE_TEST_TABLE_ID environment variables")
 class ServerTests(unittest.TestCase):